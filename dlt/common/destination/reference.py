@@ -362,16 +362,17 @@ class JobClientBase(ABC):
                     )
 
     def get_load_table(self, table_name: str, prepare_for_staging: bool = False) -> TTableSchema:
-        if table_name not in self.schema.tables:
+        tables = self.schema.tables
+        if table_name not in tables:
             return None
         try:
             # make a copy of the schema so modifications do not affect the original document
-            table = deepcopy(self.schema.tables[table_name])
+            table = deepcopy(tables[table_name])
             # add write disposition if not specified - in child tables
             if "write_disposition" not in table:
-                table["write_disposition"] = get_write_disposition(self.schema.tables, table_name)
+                table["write_disposition"] = get_write_disposition(tables, table_name)
             if "table_format" not in table:
-                table["table_format"] = get_table_format(self.schema.tables, table_name)
+                table["table_format"] = get_table_format(tables, table_name)
             return table
         except KeyError:
             raise UnknownTableException(table_name)
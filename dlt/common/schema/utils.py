@@ -643,13 +643,16 @@ def get_top_level_table(tables: TSchemaTables, table_name: str) -> TTableSchema:
 def get_child_tables(tables: TSchemaTables, table_name: str) -> List[TTableSchema]:
     """Get child tables for table name and return a list of tables ordered by ancestry so the child tables are always after their parents"""
     chain: List[TTableSchema] = []
+    # index children by parent in a single pass so tables are not scanned for each table in the chain
+    children: Dict[str, List[TTableSchema]] = {}
+    for candidate in tables.values():
+        if parent := candidate.get("parent"):
+            children.setdefault(parent, []).append(candidate)
 
     def _child(t: TTableSchema) -> None:
-        name = t["name"]
         chain.append(t)
-        for candidate in tables.values():
-            if candidate.get("parent") == name:
-                _child(candidate)
+        for child in children.get(t["name"], []):
+            _child(child)
 
     _child(tables[table_name])
     return chain
@@ -2,18 +2,21 @@ import contextlib
 import os
 from copy import deepcopy
 import datetime  # noqa: 251
+from functools import lru_cache
 import humanize
 from pathlib import Path
 from pendulum.datetime import DateTime
 from typing import (
     ClassVar,
     Dict,
+    Iterable,
     List,
     NamedTuple,
     Literal,
     Optional,
     Sequence,
     Set,
+    Tuple,
     get_args,
     cast,
 )
@@ -59,7 +62,9 @@ class ParsedLoadJobFileName(NamedTuple):
         return self._replace(retry_count=self.retry_count + 1)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse(file_name: str) -> "ParsedLoadJobFileName":
+        """Parses job file name or path. Job file names are parsed in several loader stages so results are cached"""
         p = Path(file_name)
         parts = p.name.split(".")
         if len(parts) != 4:
@@ -250,8 +255,8 @@ class PackageStorage:
         ]
 
     def list_all_jobs(self, load_id: str) -> Sequence[LoadJobInfo]:
-        info = self.get_load_package_info(load_id)
-        return [job for job in flatten_list_or_items(iter(info.jobs.values()))]  # type: ignore
+        jobs = self.get_load_package_jobs(load_id)
+        return [job for job in flatten_list_or_items(iter(jobs.values()))]  # type: ignore
 
     def list_failed_jobs_infos(self, load_id: str) -> Sequence[LoadJobInfo]:
         """List all failed jobs and associated error messages for a load package with `load_id`"""
@@ -281,6 +286,17 @@ class PackageStorage:
         """Adds new job by moving the `job_file_path` into `new_jobs` of package `load_id`"""
         self.storage.atomic_import(job_file_path, self.get_job_folder_path(load_id, job_state))
 
+    def import_jobs(self, load_id: str, jobs: Iterable[Tuple[str, TJobState]]) -> None:
+        """Adds many jobs at once by moving each `job_file_path` into the `job_state` folder of package `load_id`"""
+        # resolve each target folder once and not for every job
+        folders: Dict[TJobState, str] = {}
+        for job_file_path, job_state in jobs:
+            if (folder := folders.get(job_state)) is None:
+                folder = folders[job_state] = self.storage.make_full_path(
+                    self.get_job_folder_path(load_id, job_state)
+                )
+            FileStorage.move_atomic_to_folder(job_file_path, folder)
+
     def start_job(self, load_id: str, file_name: str) -> str:
         return self._move_job(
             load_id, PackageStorage.NEW_JOBS_FOLDER, PackageStorage.STARTED_JOBS_FOLDER, file_name
@@ -390,16 +406,13 @@ class PackageStorage:
         if not self.storage.has_folder(package_path):
             raise LoadPackageNotFound(load_id)
 
-        package_created_at: DateTime = None
         package_state = self.initial_state
         applied_update: TSchemaTables = {}
 
         # check if package completed
         completed_file_path = os.path.join(package_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME)
-        if self.storage.has_file(completed_file_path):
-            package_created_at = pendulum.from_timestamp(
-                os.path.getmtime(self.storage.make_full_path(completed_file_path))
-            )
+        package_created_at = self._get_package_completed_at(package_path)
+        if package_created_at:
             package_state = self.storage.load(completed_file_path)
 
         # check if schema updates applied
@@ -410,17 +423,6 @@ class PackageStorage:
             applied_update = json.loads(self.storage.load(applied_schema_update_file))
         schema = Schema.from_dict(self._load_schema(load_id))
 
-        # read jobs with all statuses
-        all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
-        for state in WORKING_FOLDERS:
-            jobs: List[LoadJobInfo] = []
-            with contextlib.suppress(FileNotFoundError):
-                # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
-                for file in self.storage.list_folder_files(os.path.join(package_path, state)):
-                    if not file.endswith(".exception"):
-                        jobs.append(self._read_job_file_info(state, file, package_created_at))
-            all_jobs[state] = jobs
-
         return LoadPackageInfo(
             load_id,
             self.storage.make_full_path(package_path),
@@ -428,22 +430,68 @@ class PackageStorage:
             schema,
             applied_update,
             package_created_at,
-            all_jobs,
+            self._read_package_jobs(package_path, package_created_at),
         )
 
-    def _read_job_file_info(self, state: TJobState, file: str, now: DateTime = None) -> LoadJobInfo:
-        try:
-            failed_message = self.storage.load(file + ".exception")
-        except FileNotFoundError:
-            failed_message = None
+    def get_load_package_jobs(self, load_id: str) -> Dict[TJobState, List[LoadJobInfo]]:
+        """Gets all jobs in package with given load_id grouped by their statuses. Does not load the schema and schema updates like `get_load_package_info`"""
+        package_path = self.get_package_path(load_id)
+        if not self.storage.has_folder(package_path):
+            raise LoadPackageNotFound(load_id)
+        return self._read_package_jobs(package_path, self._get_package_completed_at(package_path))
+
+    def _get_package_completed_at(self, package_path: str) -> Optional[DateTime]:
+        completed_file_path = os.path.join(package_path, PackageStorage.PACKAGE_COMPLETED_FILE_NAME)
+        if self.storage.has_file(completed_file_path):
+            return pendulum.from_timestamp(
+                os.path.getmtime(self.storage.make_full_path(completed_file_path))
+            )
+        return None
+
+    def _read_package_jobs(
+        self, package_path: str, package_created_at: DateTime
+    ) -> Dict[TJobState, List[LoadJobInfo]]:
+        # read jobs with all statuses
+        all_jobs: Dict[TJobState, List[LoadJobInfo]] = {}
+        for state in WORKING_FOLDERS:
+            jobs: List[LoadJobInfo] = []
+            state_path = os.path.join(package_path, state)
+            with contextlib.suppress(FileNotFoundError):
+                # we ignore if load package lacks one of working folders. completed_jobs may be deleted on archiving
+                with os.scandir(self.storage.make_full_path(state_path)) as entries:
+                    for entry in entries:
+                        if entry.is_file() and not entry.name.endswith(".exception"):
+                            # dir entry caches stat result (no extra syscall on some platforms)
+                            jobs.append(
+                                self._read_job_file_info(
+                                    state,
+                                    os.path.join(state_path, entry.name),
+                                    package_created_at,
+                                    entry.stat(),
+                                )
+                            )
+            all_jobs[state] = jobs
+        return all_jobs
+
+    def _read_job_file_info(
+        self, state: TJobState, file: str, now: DateTime = None, st: os.stat_result = None
+    ) -> LoadJobInfo:
+        failed_message = None
+        # exception files are saved only for failed jobs
+        if state == PackageStorage.FAILED_JOBS_FOLDER:
+            with contextlib.suppress(FileNotFoundError):
+                failed_message = self.storage.load(file + ".exception")
         full_path = self.storage.make_full_path(file)
-        st = os.stat(full_path)
+        # single stat provides size, creation and elapsed time
+        st = st or os.stat(full_path)
         return LoadJobInfo(
             state,
             full_path,
             st.st_size,
             pendulum.from_timestamp(st.st_mtime),
-            PackageStorage._job_elapsed_time_seconds(full_path, now.timestamp() if now else None),
+            PackageStorage._job_elapsed_time_seconds(
+                full_path, now.timestamp() if now else None, st.st_mtime
+            ),
             ParsedLoadJobFileName.parse(file),
             failed_message,
         )
@@ -501,5 +549,10 @@ class PackageStorage:
         )
 
     @staticmethod
-    def _job_elapsed_time_seconds(file_path: str, now_ts: float = None) -> float:
-        return (now_ts or pendulum.now().timestamp()) - os.path.getmtime(file_path)
+    def _job_elapsed_time_seconds(
+        file_path: str, now_ts: float = None, mtime: float = None
+    ) -> float:
+        """Seconds since job file at `file_path` was modified. Pass `mtime` if file was already stat-ed"""
+        if mtime is None:
+            mtime = os.path.getmtime(file_path)
+        return (now_ts or pendulum.now().timestamp()) - mtime
@@ -1,5 +1,5 @@
 from os.path import join
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 from dlt.common import json
 from dlt.common.configuration import known_sections
@@ -78,13 +78,20 @@ class LoadStorage(DataItemStorage, VersionedStorage):
 
     def list_new_jobs(self, load_id: str) -> Sequence[str]:
         """Lists all jobs in new jobs folder of normalized package storage and checks if file formats are supported"""
-        new_jobs = self.normalized_packages.list_new_jobs(load_id)
+        return [job_file for job_file, _ in self.list_new_jobs_info(load_id)]
+
+    def list_new_jobs_info(self, load_id: str) -> List[Tuple[str, ParsedLoadJobFileName]]:
+        """Same as `list_new_jobs` but also returns parsed job file names so callers do not parse them again"""
+        new_jobs = [
+            (job_file, ParsedLoadJobFileName.parse(job_file))
+            for job_file in self.normalized_packages.list_new_jobs(load_id)
+        ]
         # # make sure all jobs have supported writers
         wrong_job = next(
             (
-                j
-                for j in new_jobs
-                if ParsedLoadJobFileName.parse(j).file_format not in self.supported_file_formats
+                job_file
+                for job_file, job_info in new_jobs
+                if job_info.file_format not in self.supported_file_formats
             ),
             None,
         )
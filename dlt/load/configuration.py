@@ -14,6 +14,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    min_poll_interval: float = 0.1
+    """Initial interval in seconds to wait before checking running jobs again"""
+    max_poll_interval: float = 1.0
+    """Interval in seconds to which the wait grows if running jobs do not change state"""
     _load_storage_config: LoadStorageConfiguration = None
 
     def on_resolved(self) -> None:
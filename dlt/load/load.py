@@ -1,8 +1,12 @@
 import contextlib
 from functools import reduce
+from itertools import repeat
+from operator import itemgetter
+import sys
+import threading
 import datetime  # noqa: 251
 from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable, Callable
-from concurrent.futures import Executor
+from concurrent.futures import Executor, wait
 import os
 
 from dlt.common import sleep, logger
@@ -10,10 +14,16 @@ from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.pipeline import LoadInfo, LoadMetrics, SupportsPipeline, WithStepInfo
 from dlt.common.schema.utils import get_child_tables, get_top_level_table
-from dlt.common.storages.load_storage import LoadPackageInfo, ParsedLoadJobFileName, TJobState
+from dlt.common.storages.load_storage import (
+    LoadJobInfo,
+    LoadPackageInfo,
+    ParsedLoadJobFileName,
+    TJobState,
+)
 from dlt.common.runners import TRunMetrics, Runnable, workermethod, NullExecutor
 from dlt.common.runtime.collector import Collector, NULL_COLLECTOR
 from dlt.common.runtime.logger import pretty_format_exception
+from dlt.common.runtime import signals
 from dlt.common.exceptions import (
     TerminalValueError,
     DestinationTerminalException,
@@ -71,6 +81,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.pool = NullExecutor()
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
         self._loaded_packages: List[LoadPackageInfo] = []
+        # clients opened by pool workers, kept open until the package is completed
+        self._job_clients: List[JobClientBase] = []
+        # each worker thread keeps its own clients as most client libraries are not thread safe
+        self._thread_job_clients = threading.local()
+        self._job_clients_lock = threading.Lock()
         super().__init__()
 
     def create_storage(self, is_storage_owner: bool) -> LoadStorage:
@@ -114,47 +129,112 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         else:
             yield
 
+    def resolve_job_table(
+        self, file_path: str, job_client: JobClientBase, staging_client: JobClientBase = None
+    ) -> Tuple[TTableSchema, bool]:
+        """Gets load table for a job in `file_path` and tells if the job goes to the staging dataset.
+
+        Only schema and configuration of the (not entered) clients are used so no destination i/o happens here.
+        """
+        job_info = ParsedLoadJobFileName.parse(file_path)
+        if job_info.file_format not in self.load_storage.supported_file_formats:
+            raise LoadClientUnsupportedFileFormats(
+                job_info.file_format,
+                self.capabilities.supported_loader_file_formats,
+                file_path,
+            )
+        # if we have a staging destination and the file is not a reference, send to staging
+        is_staging_destination_job = self.is_staging_destination_job(file_path)
+        client = staging_client if is_staging_destination_job else job_client
+        table = client.get_load_table(job_info.table_name)
+        if table["write_disposition"] not in ["append", "replace", "merge"]:
+            raise LoadClientUnsupportedWriteDisposition(
+                job_info.table_name, table["write_disposition"], file_path
+            )
+
+        if is_staging_destination_job:
+            use_staging_dataset = isinstance(
+                job_client, SupportsStagingDestination
+            ) and job_client.should_load_data_to_staging_dataset_on_staging_destination(table)
+        else:
+            use_staging_dataset = isinstance(
+                job_client, WithStagingDataset
+            ) and job_client.should_load_data_to_staging_dataset(table)
+        return table, use_staging_dataset
+
+    @contextlib.contextmanager
+    def _borrow_job_client(self, schema: Schema, staging: bool) -> Iterator[JobClientBase]:
+        """Borrows an opened (staging) destination client of the current thread or opens a new one so the connection is
+        established once per worker thread and not for each spooled or retrieved job. Clients are closed with `_close_job_clients`
+        """
+        thread_local = self._thread_job_clients
+        thread_clients: Dict[bool, JobClientBase] = getattr(thread_local, "clients", None)
+        if thread_clients is None:
+            thread_clients = thread_local.clients = {}
+        if (client := thread_clients.pop(staging, None)) is None:
+            client = (
+                self.get_staging_destination_client(schema)
+                if staging
+                else self.get_destination_client(schema)
+            )
+            client.__enter__()
+            with self._job_clients_lock:
+                self._job_clients.append(client)
+        try:
+            yield client
+        except Exception:
+            # client that raised may be in a broken state so it is closed and not reused
+            with self._job_clients_lock:
+                # client may be already closed with others
+                if client in self._job_clients:
+                    self._job_clients.remove(client)
+                else:
+                    client = None
+            if client is not None:
+                try:
+                    client.__exit__(*sys.exc_info())
+                except Exception:
+                    logger.exception(
+                        f"Problem when closing {client.config.destination_type} client"
+                    )
+            raise
+        thread_clients[staging] = client
+
+    def _close_job_clients(self) -> None:
+        with self._job_clients_lock:
+            clients, self._job_clients = self._job_clients, []
+            # drop clients cached by worker threads
+            self._thread_job_clients = threading.local()
+        for client in clients:
+            try:
+                client.__exit__(None, None, None)
+            except Exception:
+                logger.exception(f"Problem when closing {client.config.destination_type} client")
+
+    def _get_spool_clients(self, schema: Schema) -> Tuple[JobClientBase, JobClientBase]:
+        return self.get_destination_client(schema), (
+            self.get_staging_destination_client(schema) if self.staging_destination else None
+        )
+
     @staticmethod
     @workermethod
     def w_spool_job(
-        self: "Load", file_path: str, load_id: str, schema: Schema
+        self: "Load",
+        file_path: str,
+        load_id: str,
+        schema: Schema,
+        job_table: Tuple[TTableSchema, bool] = None,
     ) -> Optional[LoadJob]:
         job: LoadJob = None
         try:
-            is_staging_destination_job = self.is_staging_destination_job(file_path)
-            job_client = self.get_destination_client(schema)
-
-            # if we have a staging destination and the file is not a reference, send to staging
-            with (
-                self.get_staging_destination_client(schema)
-                if is_staging_destination_job
-                else job_client
+            # table is typically resolved upfront in `spool_new_jobs`
+            table, use_staging_dataset = job_table or self.resolve_job_table(
+                file_path, *self._get_spool_clients(schema)
+            )
+            logger.info(f"Will load file {file_path} with table name {table['name']}")
+            with self._borrow_job_client(
+                schema, self.is_staging_destination_job(file_path)
             ) as client:
-                job_info = ParsedLoadJobFileName.parse(file_path)
-                if job_info.file_format not in self.load_storage.supported_file_formats:
-                    raise LoadClientUnsupportedFileFormats(
-                        job_info.file_format,
-                        self.capabilities.supported_loader_file_formats,
-                        file_path,
-                    )
-                logger.info(f"Will load file {file_path} with table name {job_info.table_name}")
-                table = client.get_load_table(job_info.table_name)
-                if table["write_disposition"] not in ["append", "replace", "merge"]:
-                    raise LoadClientUnsupportedWriteDisposition(
-                        job_info.table_name, table["write_disposition"], file_path
-                    )
-
-                if is_staging_destination_job:
-                    use_staging_dataset = isinstance(
-                        job_client, SupportsStagingDestination
-                    ) and job_client.should_load_data_to_staging_dataset_on_staging_destination(
-                        table
-                    )
-                else:
-                    use_staging_dataset = isinstance(
-                        job_client, WithStagingDataset
-                    ) and job_client.should_load_data_to_staging_dataset(table)
-
                 with self.maybe_with_staging_dataset(client, use_staging_dataset):
                     job = client.start_file_load(
                         table,
@@ -174,52 +254,82 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
 
     def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
         # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        load_files = self.load_storage.list_new_jobs(load_id)[: self.config.workers]
+        # group files of the same table so each batch of jobs hits as few destination tables as possible
+        # file names are parsed once when listed, so they are not parsed again for sorting
+        new_jobs = sorted(
+            self.load_storage.list_new_jobs_info(load_id),
+            # table_name and file_format
+            key=lambda job: itemgetter(0, 3)(job[1]),
+        )[: self.config.workers]
+        load_files = [job_file for job_file, _ in new_jobs]
         file_count = len(load_files)
         if file_count == 0:
             logger.info(f"No new jobs found in {load_id}")
             return 0, []
         logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
+        # resolve tables on the main thread so pool workers do not compete for GIL and only
+        # do the destination i/o. if resolution fails, the worker repeats it and fails the job
+        spool_clients = self._get_spool_clients(schema)
+        job_tables: List[Tuple[TTableSchema, bool]] = []
+        for file in load_files:
+            try:
+                job_tables.append(self.resolve_job_table(file, *spool_clients))
+            except Exception:
+                job_tables.append(None)
         # exceptions should not be raised, None as job is a temporary failure
         # other jobs should not be affected
-        jobs = self.pool.map(Load.w_spool_job, *zip(*param_chunk))
+        # NOTE: a task per file, at most `workers` files are spooled so chunking would not help
+        jobs = self.pool.map(
+            Load.w_spool_job,
+            repeat(id(self)),
+            load_files,
+            repeat(load_id),
+            repeat(schema),
+            job_tables,
+        )
         # remove None jobs and check the rest
         return file_count, [job for job in jobs if job is not None]
 
-    def retrieve_jobs(
-        self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None
-    ) -> Tuple[int, List[LoadJob]]:
-        jobs: List[LoadJob] = []
+    @staticmethod
+    @workermethod
+    def w_retrieve_job(self: "Load", file_path: str, schema: Schema) -> LoadJob:
+        try:
+            logger.info(f"Will retrieve {file_path}")
+            with self._borrow_job_client(
+                schema, self.is_staging_destination_job(file_path)
+            ) as client:
+                job = client.restore_file_load(file_path)
+        except DestinationTerminalException:
+            logger.exception(f"Job retrieval for {file_path} failed, job will be terminated")
+            job = EmptyLoadJob.from_file_path(file_path, "failed", pretty_format_exception())
+            # proceed to appending job, do not reraise
+        except (DestinationTransientException, Exception):
+            # raise on all temporary exceptions, typically network / server problems
+            raise
+        return job
 
+    def retrieve_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
         # list all files that were started but not yet completed
         started_jobs = self.load_storage.normalized_packages.list_started_jobs(load_id)
 
         logger.info(f"Found {len(started_jobs)} that are already started and should be continued")
         if len(started_jobs) == 0:
-            return 0, jobs
+            return 0, []
 
-        for file_path in started_jobs:
-            try:
-                logger.info(f"Will retrieve {file_path}")
-                client = staging_client if self.is_staging_destination_job(file_path) else client
-                job = client.restore_file_load(file_path)
-            except DestinationTerminalException:
-                logger.exception(f"Job retrieval for {file_path} failed, job will be terminated")
-                job = EmptyLoadJob.from_file_path(file_path, "failed", pretty_format_exception())
-                # proceed to appending job, do not reraise
-            except (DestinationTransientException, Exception):
-                # raise on all temporary exceptions, typically network / server problems
-                raise
-            jobs.append(job)
+        # restore jobs in the pool as each restore is typically a call to the destination
+        futures = [
+            self.pool.submit(Load.w_retrieve_job, id(self), file_path, schema)  # type: ignore[arg-type]
+            for file_path in started_jobs
+        ]
+        # wait for all restores before raising so no worker is using a client when clients get closed
+        wait(futures)
+        # temporary exceptions are raised when results are collected
+        jobs = [future.result() for future in futures]
 
         return len(jobs), jobs
 
     def get_new_jobs_info(self, load_id: str) -> List[ParsedLoadJobFileName]:
-        return [
-            ParsedLoadJobFileName.parse(job_file)
-            for job_file in self.load_storage.list_new_jobs(load_id)
-        ]
+        return [job_info for _, job_info in self.load_storage.list_new_jobs_info(load_id)]
 
     def get_completed_table_chain(
         self,
@@ -234,11 +344,13 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         """
         # returns ordered list of tables from parent to child leaf tables
         table_chain: List[TTableSchema] = []
+        # list package jobs once and not for each table in the chain
+        jobs_by_table: Dict[str, List[LoadJobInfo]] = {}
+        for job in self.load_storage.normalized_packages.list_all_jobs(load_id):
+            jobs_by_table.setdefault(job.job_file_info.table_name, []).append(job)
         # make sure all the jobs for the table chain is completed
         for table in get_child_tables(schema.tables, top_merged_table["name"]):
-            table_jobs = self.load_storage.normalized_packages.list_jobs_for_table(
-                load_id, table["name"]
-            )
+            table_jobs = jobs_by_table.get(table["name"], [])
             # all jobs must be completed in order for merge to be created
             if any(
                 job.state not in ("failed_jobs", "completed_jobs")
@@ -263,26 +375,27 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             # NOTE: we may move that logic to the interface
             starting_job_file_name = starting_job.file_name()
             if state == "completed" and not self.is_staging_destination_job(starting_job_file_name):
-                client = self.destination.client(schema, self.initial_client_config)
-                top_job_table = get_top_level_table(
-                    schema.tables, starting_job.job_file_info().table_name
-                )
+                starting_job_info = starting_job.job_file_info()
+                top_job_table = get_top_level_table(schema.tables, starting_job_info.table_name)
                 # if all tables of chain completed, create follow  up jobs
                 if table_chain := self.get_completed_table_chain(
-                    load_id, schema, top_job_table, starting_job.job_file_info().job_id()
+                    load_id, schema, top_job_table, starting_job_info.job_id()
                 ):
+                    # followup jobs are created without destination i/o so the client is not opened
+                    client = self.get_destination_client(schema)
                     if follow_up_jobs := client.create_table_chain_completed_followup_jobs(
                         table_chain
                     ):
-                        jobs = jobs + follow_up_jobs
-            jobs = jobs + starting_job.create_followup_jobs(state)
+                        jobs.extend(follow_up_jobs)
+            jobs.extend(starting_job.create_followup_jobs(state))
         return jobs
 
     def complete_jobs(self, load_id: str, jobs: List[LoadJob], schema: Schema) -> List[LoadJob]:
         remaining_jobs: List[LoadJob] = []
+        finished_count = failed_count = 0
+        package_storage = self.load_storage.normalized_packages
         logger.info(f"Will complete {len(jobs)} for {load_id}")
-        for ii in range(len(jobs)):
-            job = jobs[ii]
+        for job in jobs:
             logger.debug(f"Checking state for job {job.job_id()}")
             state: TLoadJobState = job.state()
             if state == "running":
@@ -290,11 +403,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 logger.debug(f"job {job.job_id()} still running")
                 remaining_jobs.append(job)
             elif state == "failed":
+                finished_count += 1
+                failed_count += 1
                 # try to get exception message from job
                 failed_message = job.exception()
-                self.load_storage.normalized_packages.fail_job(
-                    load_id, job.file_name(), failed_message
-                )
+                package_storage.fail_job(load_id, job.file_name(), failed_message)
                 logger.error(
                     f"Job for {job.job_id()} failed terminally in load {load_id} with message"
                     f" {failed_message}"
@@ -303,44 +416,52 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 # try to get exception message from job
                 retry_message = job.exception()
                 # move back to new folder to try again
-                self.load_storage.normalized_packages.retry_job(load_id, job.file_name())
+                package_storage.retry_job(load_id, job.file_name())
                 logger.warning(
                     f"Job for {job.job_id()} retried in load {load_id} with message {retry_message}"
                 )
             elif state == "completed":
+                finished_count += 1
                 # create followup jobs
                 followup_jobs = self.create_followup_jobs(load_id, state, job, schema)
+                followup_imports: List[Tuple[str, TJobState]] = []
                 for followup_job in followup_jobs:
                     # running should be moved into "new jobs", other statuses into started
-                    folder: TJobState = (
-                        "new_jobs" if followup_job.state() == "running" else "started_jobs"
-                    )
-                    # save all created jobs
-                    self.load_storage.normalized_packages.import_job(
-                        load_id, followup_job.new_file_path(), job_state=folder
-                    )
+                    if followup_job.state() == "running":
+                        folder: TJobState = "new_jobs"
+                    else:
+                        folder = "started_jobs"
+                        # if followup job is not "running" place it in current queue to be finalized
+                        remaining_jobs.append(followup_job)
+                    followup_imports.append((followup_job.new_file_path(), folder))
+                # save all created jobs
+                package_storage.import_jobs(load_id, followup_imports)
+                for new_file_path, folder in followup_imports:
                     logger.info(
-                        f"Job {job.job_id()} CREATED a new FOLLOWUP JOB"
-                        f" {followup_job.new_file_path()} placed in {folder}"
+                        f"Job {job.job_id()} CREATED a new FOLLOWUP JOB {new_file_path} placed in"
+                        f" {folder}"
                     )
-                    # if followup job is not "running" place it in current queue to be finalized
-                    if not followup_job.state() == "running":
-                        remaining_jobs.append(followup_job)
                 # move to completed folder after followup jobs are created
                 # in case of exception when creating followup job, the loader will retry operation and try to complete again
-                self.load_storage.normalized_packages.complete_job(load_id, job.file_name())
+                package_storage.complete_job(load_id, job.file_name())
                 logger.info(f"Job for {job.job_id()} completed in load {load_id}")
 
-            if state in ["failed", "completed"]:
-                self.collector.update("Jobs")
-                if state == "failed":
-                    self.collector.update(
-                        "Jobs", 1, message="WARNING: Some of the jobs failed!", label="Failed"
-                    )
-
+        # update collector once per pass and not for each job
+        if finished_count:
+            self.collector.update("Jobs", finished_count)
+        if failed_count:
+            self.collector.update(
+                "Jobs", failed_count, message="WARNING: Some of the jobs failed!", label="Failed"
+            )
+        # if all jobs are still running return the same list so caller can tell no progress was made
+        # (retried jobs are dropped and completed ones counted so equal length means all are running)
+        if finished_count == 0 and len(remaining_jobs) == len(jobs):
+            return jobs
         return remaining_jobs
 
     def complete_package(self, load_id: str, schema: Schema, aborted: bool = False) -> None:
+        # no more jobs will be spooled for the package
+        self._close_job_clients()
         # do not commit load id for aborted packages
         if not aborted:
             with self.get_destination_client(schema) as job_client:
@@ -361,18 +482,22 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
     ) -> Set[str]:
         """Get all jobs for tables with given write disposition and resolve the table chain"""
         result: Set[str] = set()
+        tables = schema.tables
+        # tables with jobs in the same chain share the top level table, visit each chain once
+        seen_top_tables: Set[str] = set()
         for table_name in tables_with_jobs:
-            top_job_table = get_top_level_table(schema.tables, table_name)
+            top_job_table = get_top_level_table(tables, table_name)
+            if top_job_table["name"] in seen_top_tables:
+                continue
+            seen_top_tables.add(top_job_table["name"])
             if not f(top_job_table):
                 continue
-            for table in get_child_tables(schema.tables, top_job_table["name"]):
+            is_replace = top_job_table["write_disposition"] == "replace"
+            for table in get_child_tables(tables, top_job_table["name"]):
                 # only add tables for tables that have jobs unless the disposition is replace
                 # TODO: this is a (formerly used) hack to make test_merge_on_keys_in_schema,
                 # we should change that test
-                if (
-                    not table["name"] in tables_with_jobs
-                    and top_job_table["write_disposition"] != "replace"
-                ):
+                if not table["name"] in tables_with_jobs and not is_replace:
                     continue
                 result.add(table["name"])
         return result
@@ -409,11 +534,10 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         job_client: JobClientBase,
         schema: Schema,
         expected_update: TSchemaTables,
-        load_id: str,
+        tables_with_jobs: Set[str],
         truncate_filter: Callable[[TTableSchema], bool],
         truncate_staging_filter: Callable[[TTableSchema], bool],
     ) -> TSchemaTables:
-        tables_with_jobs = set(job.table_name for job in self.get_new_jobs_info(load_id))
         dlt_tables = set(t["name"] for t in schema.dlt_tables())
 
         # update the default dataset
@@ -441,15 +565,17 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         return applied_update
 
     def load_single_package(self, load_id: str, schema: Schema) -> None:
-        # initialize analytical storage ie. create dataset required by passed schema
-        with self.get_destination_client(schema) as job_client:
-            if (expected_update := self.load_storage.begin_schema_update(load_id)) is not None:
+        if (expected_update := self.load_storage.begin_schema_update(load_id)) is not None:
+            # list and parse new jobs once for destination and staging destination
+            tables_with_jobs = {job.table_name for job in self.get_new_jobs_info(load_id)}
+            # initialize analytical storage ie. create dataset required by passed schema
+            with self.get_destination_client(schema) as job_client:
                 # init job client
                 applied_update = self._init_client(
                     job_client,
                     schema,
                     expected_update,
-                    load_id,
+                    tables_with_jobs,
                     job_client.should_truncate_table_before_load,
                     (
                         job_client.should_load_data_to_staging_dataset
@@ -469,20 +595,15 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                             staging_client,
                             schema,
                             expected_update,
-                            load_id,
+                            tables_with_jobs,
                             job_client.should_truncate_table_before_load_on_staging_destination,
                             job_client.should_load_data_to_staging_dataset_on_staging_destination,
                         )
 
                 self.load_storage.commit_schema_update(load_id, applied_update)
 
-            # initialize staging destination and spool or retrieve unfinished jobs
-            if self.staging_destination:
-                with self.get_staging_destination_client(schema) as staging_client:
-                    jobs_count, jobs = self.retrieve_jobs(job_client, load_id, staging_client)
-            else:
-                jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
-
+        # retrieve unfinished jobs or spool new ones
+        jobs_count, jobs = self.retrieve_jobs(load_id, schema)
         if not jobs:
             # jobs count is a total number of jobs including those that could not be initialized
             jobs_count, jobs = self.spool_new_jobs(load_id, schema)
@@ -501,6 +622,7 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                 "Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed"
             )
         # loop until all jobs are processed
+        poll_interval = self.config.min_poll_interval
         while True:
             try:
                 remaining_jobs = self.complete_jobs(load_id, jobs, schema)
@@ -530,10 +652,18 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
                                     self.config.raise_on_max_retries,
                                 )
                     break
+                # wait only if no job reached terminal state in this pass. otherwise poll again
+                # right away so followup jobs and jobs finished meanwhile are not delayed
+                if remaining_jobs is jobs:
+                    # this will raise on signal
+                    sleep(poll_interval)
+                    # back off while jobs keep running
+                    poll_interval = min(poll_interval * 1.5, self.config.max_poll_interval)
+                else:
+                    signals.raise_if_signalled()
+                    poll_interval = self.config.min_poll_interval
                 # process remaining jobs again
                 jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
             except LoadClientJobFailed:
                 # the package is completed and skipped
                 self.complete_package(load_id, schema, True)
@@ -561,7 +691,12 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             # the same load id may be processed across multiple runs
             if not self.current_load_id:
                 self._step_info_start_load_id(load_id)
-            self.load_single_package(load_id, schema)
+            try:
+                self.load_single_package(load_id, schema)
+            except BaseException:
+                # also on signals and keyboard interrupt so connections and file locks are released
+                self._close_job_clients()
+                raise
 
         return TRunMetrics(False, len(self.load_storage.list_normalized_packages()))
 
@@ -789,3 +789,26 @@ def test_group_tables_by_resource(schema: Schema) -> None:
             {"columns": {}, "name": "mc_products__sub", "parent": "mc_products"},
         ]
     }
+
+
+def test_get_child_tables(schema: Schema) -> None:
+    schema.update_table(utils.new_table("a_events", columns=[]))
+    schema.update_table(utils.new_table("a_events__1", columns=[], parent_table_name="a_events"))
+    schema.update_table(utils.new_table("a_events__2", columns=[], parent_table_name="a_events"))
+    schema.update_table(
+        utils.new_table("a_events__1__2", columns=[], parent_table_name="a_events__1")
+    )
+    schema.update_table(utils.new_table("b_events", columns=[]))
+
+    # children follow their parents, siblings keep the schema order
+    assert [t["name"] for t in utils.get_child_tables(schema.tables, "a_events")] == [
+        "a_events",
+        "a_events__1",
+        "a_events__1__2",
+        "a_events__2",
+    ]
+    assert [t["name"] for t in utils.get_child_tables(schema.tables, "a_events__1")] == [
+        "a_events__1",
+        "a_events__1__2",
+    ]
+    assert utils.get_child_tables(schema.tables, "b_events") == [schema.tables["b_events"]]
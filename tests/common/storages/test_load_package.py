@@ -1,14 +1,17 @@
 import os
 import pytest
 from pathlib import Path
+from typing import List, Tuple
 
-from dlt.common import sleep
+from dlt.common import pendulum, sleep
 from dlt.common.schema import Schema
 from dlt.common.storages import PackageStorage, LoadStorage, ParsedLoadJobFileName
+from dlt.common.storages.exceptions import LoadPackageNotFound
+from dlt.common.storages.load_package import TJobState
 from dlt.common.utils import uniq_id
 
 from tests.common.storages.utils import start_loading_file, assert_package_info, load_storage
-from tests.utils import autouse_test_storage
+from tests.utils import autouse_test_storage, TEST_STORAGE_ROOT
 
 
 def test_is_partially_loaded(load_storage: LoadStorage) -> None:
@@ -38,6 +41,46 @@ def test_is_partially_loaded(load_storage: LoadStorage) -> None:
     assert PackageStorage.is_package_partially_loaded(info) is True
 
 
+def test_get_load_package_jobs(load_storage: LoadStorage) -> None:
+    load_id, file_name = start_loading_file(load_storage, [{"content": "a"}, {"content": "b"}])
+    jobs = load_storage.normalized_packages.get_load_package_jobs(load_id)
+    # same jobs as in package info
+    info = load_storage.normalized_packages.get_load_package_info(load_id)
+    for state, state_jobs in info.jobs.items():
+        assert [job.file_path for job in jobs[state]] == [job.file_path for job in state_jobs]
+    assert [job.job_file_info.file_name() for job in jobs["started_jobs"]] == [file_name]
+    all_jobs = load_storage.normalized_packages.list_all_jobs(load_id)
+    assert [job.state for job in all_jobs] == ["started_jobs"]
+    with pytest.raises(LoadPackageNotFound):
+        load_storage.normalized_packages.get_load_package_jobs(uniq_id())
+
+
+def test_import_jobs(load_storage: LoadStorage) -> None:
+    load_id, _ = start_loading_file(load_storage, [{"content": "a"}])
+    imports: List[Tuple[str, TJobState]] = [
+        (
+            os.path.join(TEST_STORAGE_ROOT, "event_a.839c6e6b514e427687586ccc65bf133f.0.jsonl"),
+            "new_jobs",
+        ),
+        (
+            os.path.join(TEST_STORAGE_ROOT, "event_b.839c6e6b514e427687586ccc65bf133f.0.jsonl"),
+            "started_jobs",
+        ),
+        (
+            os.path.join(TEST_STORAGE_ROOT, "event_c.839c6e6b514e427687586ccc65bf133f.0.jsonl"),
+            "started_jobs",
+        ),
+    ]
+    for file_path, _ in imports:
+        Path(file_path).write_text("{}", encoding="utf-8")
+    load_storage.normalized_packages.import_jobs(load_id, imports)
+    # files were moved into the state folders
+    assert not any(os.path.isfile(file_path) for file_path, _ in imports)
+    jobs = load_storage.normalized_packages.get_load_package_jobs(load_id)
+    for file_path, state in imports:
+        assert os.path.basename(file_path) in [job.job_file_info.file_name() for job in jobs[state]]
+
+
 def test_save_load_schema(load_storage: LoadStorage) -> None:
     # mock schema version to some random number so we know we load what we save
     schema = Schema("event")
@@ -74,6 +117,11 @@ def test_job_elapsed_time_seconds(load_storage: LoadStorage) -> None:
     elapsed_2 = PackageStorage._job_elapsed_time_seconds(fp)
     # it should keep its mod original date after rename
     assert elapsed_2 - elapsed >= 0.3
+    # use mtime from already stat-ed file
+    now_ts = pendulum.now().timestamp()
+    assert PackageStorage._job_elapsed_time_seconds(
+        fp, now_ts, os.path.getmtime(fp)
+    ) == PackageStorage._job_elapsed_time_seconds(fp, now_ts)
 
 
 def test_retry_job(load_storage: LoadStorage) -> None:
@@ -103,6 +151,8 @@ def test_build_parse_job_path(load_storage: LoadStorage) -> None:
     assert ParsedLoadJobFileName.parse(job_f_n) == f_n_t
     # also parses full paths correctly
     assert ParsedLoadJobFileName.parse("load_id/" + job_f_n) == f_n_t
+    # parsed file names are cached
+    assert ParsedLoadJobFileName.parse(job_f_n) is ParsedLoadJobFileName.parse(job_f_n)
 
     # parts cannot contain dots
     with pytest.raises(ValueError):
@@ -1,14 +1,21 @@
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 import pytest
 from unittest.mock import patch
 from typing import List
 
-from dlt.common.exceptions import TerminalException, TerminalValueError
+from dlt.common.exceptions import (
+    DestinationTransientException,
+    SignalReceivedException,
+    TerminalException,
+    TerminalValueError,
+)
 from dlt.common.storages import FileStorage, LoadStorage, PackageStorage, ParsedLoadJobFileName
 from dlt.common.storages.load_storage import JobWithUnsupportedWriterException
 from dlt.common.destination.reference import LoadJob, TDestination
+from dlt.common.runtime.collector import DictCollector
 
 from dlt.load import Load
 from dlt.destinations.job_impl import EmptyLoadJob
@@ -16,8 +23,12 @@ from dlt.destinations.job_impl import EmptyLoadJob
 from dlt.destinations import dummy
 from dlt.destinations.impl.dummy import dummy as dummy_impl
 from dlt.destinations.impl.dummy.configuration import DummyClientConfiguration
-from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry
-from dlt.common.schema.utils import get_top_level_table
+from dlt.load.exceptions import (
+    LoadClientJobFailed,
+    LoadClientJobRetry,
+    LoadClientUnsupportedWriteDisposition,
+)
+from dlt.common.schema.utils import get_child_tables, get_top_level_table, new_table
 
 from tests.utils import (
     clean_test_storage,
@@ -98,12 +109,50 @@ def test_unsupported_write_disposition() -> None:
     )
 
 
+def test_resolve_job_table() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    job_client = load.get_destination_client(schema)
+    table, use_staging_dataset = load.resolve_job_table(NORMALIZED_FILES[0], job_client)
+    assert table["name"] == "event_user"
+    assert table["write_disposition"] == "append"
+    assert use_staging_dataset is False
+    # unsupported disposition raises, w_spool_job will fail the job
+    schema.get_table("event_user")["write_disposition"] = "skip"
+    with pytest.raises(LoadClientUnsupportedWriteDisposition):
+        load.resolve_job_table(NORMALIZED_FILES[0], job_client)
+
+
+def test_get_table_chain_tables_with_filter() -> None:
+    load = setup_loader()
+    _, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    schema.update_table(new_table("event_user__items", columns=[], parent_table_name="event_user"))
+    schema.update_table(
+        new_table("event_user__items__tags", columns=[], parent_table_name="event_user__items")
+    )
+    tables_with_jobs = {"event_user", "event_user__items__tags", "event_loop_interrupted"}
+    # only tables with jobs are taken from the chain if disposition is not replace
+    assert Load._get_table_chain_tables_with_filter(
+        schema, lambda t: t["name"] == "event_user", tables_with_jobs
+    ) == {"event_user", "event_user__items__tags"}
+    # all tables in the chain are taken for replace
+    schema.get_table("event_user")["write_disposition"] = "replace"
+    assert Load._get_table_chain_tables_with_filter(
+        schema, lambda t: t["write_disposition"] == "replace", tables_with_jobs
+    ) == {t["name"] for t in get_child_tables(schema.tables, "event_user")}
+
+
 def test_get_new_jobs_info() -> None:
     load = setup_loader()
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
 
     # no write disposition specified - get all new jobs
     assert len(load.get_new_jobs_info(load_id)) == 2
+    # parsed job file names are returned with the file paths
+    new_jobs = load.load_storage.list_new_jobs_info(load_id)
+    assert [job_file for job_file, _ in new_jobs] == load.load_storage.list_new_jobs(load_id)
+    for job_file, job_info in new_jobs:
+        assert job_info == ParsedLoadJobFileName.parse(job_file)
 
 
 def test_get_completed_table_chain_single_job_per_table() -> None:
@@ -184,6 +233,26 @@ def test_spool_job_failed() -> None:
     assert len(package_info.jobs["failed_jobs"]) == 2
 
 
+def test_complete_jobs_updates_collector() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    files = load.load_storage.normalized_packages.list_new_jobs(load_id)
+    jobs = [Load.w_spool_job(load, f, load_id, schema) for f in files]
+    with DictCollector()("Load") as collector:
+        load.collector = collector
+        assert load.complete_jobs(load_id, jobs, schema) == []
+        assert collector.counters["Jobs"] == 2
+
+
+def test_complete_jobs_no_progress_returns_same_list() -> None:
+    # jobs never complete
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    files = load.load_storage.normalized_packages.list_new_jobs(load_id)
+    jobs = [Load.w_spool_job(load, f, load_id, schema) for f in files]
+    assert load.complete_jobs(load_id, jobs, schema) is jobs
+
+
 def test_spool_job_failed_exception_init() -> None:
     # this config fails job on start
     os.environ["LOAD__RAISE_ON_FAILED_JOBS"] = "true"
@@ -241,6 +310,81 @@ def test_spool_job_retry_spool_new() -> None:
         assert len(jobs) == 2
 
 
+def test_spool_jobs_reuse_clients() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with patch.object(
+        dummy_impl.DummyClient, "__enter__", autospec=True, side_effect=lambda c: c
+    ) as enter, patch.object(dummy_impl.DummyClient, "__exit__", autospec=True) as exit_:
+        # single threaded pool: one client opened for both jobs
+        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
+        assert jobs_count == 2
+        assert enter.call_count == 1
+        exit_.assert_not_called()
+        # clients are closed when package completes
+        load._close_job_clients()
+        assert exit_.call_count == 1
+
+
+def test_failed_jobs_close_job_clients() -> None:
+    # jobs raise transient exception when started
+    load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with patch.object(dummy_impl.DummyClient, "__exit__", autospec=True) as exit_:
+        for _ in range(5):
+            _, jobs = load.spool_new_jobs(load_id, schema)
+            assert [job.state() for job in jobs] == ["retry", "retry"]
+            # clients that raised are closed right away and not kept open
+            assert len(load._job_clients) == 0
+            # move jobs back to new jobs
+            load.complete_jobs(load_id, jobs, schema)
+        assert exit_.call_count == 10
+
+
+def test_signal_closes_job_clients() -> None:
+    # jobs never complete
+    load = setup_loader()
+    prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with patch("dlt.load.load.sleep", side_effect=SignalReceivedException(2)):
+        with pytest.raises(SignalReceivedException):
+            load.run(None)
+    assert load._job_clients == []
+
+
+def test_job_clients_per_thread() -> None:
+    load = setup_loader()
+    _, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+
+    def _borrow() -> int:
+        with load._borrow_job_client(schema, False) as client:
+            return id(client)
+
+    # same thread gets the same client
+    main_client_id = _borrow()
+    assert _borrow() == main_client_id
+    # other thread opens its own client
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(_borrow).result() != main_client_id
+    assert len(load._job_clients) == 2
+    load._close_job_clients()
+    assert load._job_clients == []
+    # new client is opened after clients are closed
+    _borrow()
+    assert len(load._job_clients) == 1
+
+
+def test_spool_jobs_grouped_by_table() -> None:
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    # list files in reverse table order
+    new_jobs = sorted(load.load_storage.list_new_jobs_info(load_id), reverse=True)
+    # batch is selected from files sorted by table so files of the same table are spooled together
+    with patch.object(load.load_storage, "list_new_jobs_info", return_value=new_jobs):
+        _, jobs = load.spool_new_jobs(load_id, schema)
+    assert [job.job_file_info().table_name for job in jobs] == ["event_loop_interrupted"]
+
+
 def test_spool_job_retry_started() -> None:
     # this config keeps the job always running
     load = setup_loader()
@@ -289,22 +433,63 @@ def test_try_retrieve_job() -> None:
         )
     # dummy client may retrieve jobs that it created itself, jobs in started folder are unknown
     # and returned as terminal
-    with load.destination.client(schema, load.initial_client_config) as c:
-        job_count, jobs = load.retrieve_jobs(c, load_id)
-        assert job_count == 2
-        for j in jobs:
-            assert j.state() == "failed"
+    job_count, jobs = load.retrieve_jobs(load_id, schema)
+    assert job_count == 2
+    for j in jobs:
+        assert j.state() == "failed"
     # new load package
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
     load.pool = ThreadPoolExecutor()
     jobs_count, jobs = load.spool_new_jobs(load_id, schema)
     assert jobs_count == 2
     # now jobs are known
-    with load.destination.client(schema, load.initial_client_config) as c:
-        job_count, jobs = load.retrieve_jobs(c, load_id)
-        assert job_count == 2
-        for j in jobs:
-            assert j.state() == "running"
+    job_count, jobs = load.retrieve_jobs(load_id, schema)
+    assert job_count == 2
+    for j in jobs:
+        assert j.state() == "running"
+
+
+def test_retrieve_jobs_transient_exception() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    load.pool = ThreadPoolExecutor(max_workers=2)
+    load.spool_new_jobs(load_id, schema)
+    load._close_job_clients()
+    restored: List[str] = []
+    restore_file_load = dummy_impl.DummyClient.restore_file_load
+    # both restores run at the same time, each on its own pool thread
+    started = threading.Barrier(2, timeout=5)
+    # set by the test once retrieve_jobs raised, the successful restore does not finish before
+    released = threading.Event()
+
+    def _restore_file_load(client: dummy_impl.DummyClient, file_path: str) -> LoadJob:
+        started.wait()
+        if "event_user" in file_path:
+            raise DestinationTransientException("restore failed")
+        # still running when the other restore raises. retrieve_jobs must wait for it and will
+        # only get the result after the timeout
+        released.wait(timeout=0.5)
+        job = restore_file_load(client, file_path)
+        restored.append(file_path)
+        return job
+
+    # failing job comes first so its result is collected before the other restore finishes
+    started_jobs = sorted(
+        load.load_storage.normalized_packages.list_started_jobs(load_id),
+        key=lambda f: "event_user" not in f,
+    )
+    with patch.object(
+        dummy_impl.DummyClient, "restore_file_load", autospec=True, side_effect=_restore_file_load
+    ), patch.object(
+        load.load_storage.normalized_packages, "list_started_jobs", return_value=started_jobs
+    ):
+        with pytest.raises(DestinationTransientException):
+            load.retrieve_jobs(load_id, schema)
+        # exception is raised only after all restores finished
+        assert len(restored) == 1
+        released.set()
+    # client that raised was closed, the other is still open
+    assert len(load._job_clients) == 1
 
 
 def test_completed_loop() -> None:
@@ -380,6 +565,24 @@ def test_retry_exceptions() -> None:
         assert py_ex.value.max_retry_count * 2 == py_ex.value.retry_count == 10
 
 
+def test_poll_interval_backoff() -> None:
+    os.environ["LOAD__MAX_POLL_INTERVAL"] = "0.3"
+    # jobs never complete
+    load = setup_loader()
+    prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    intervals: List[float] = []
+
+    def _sleep(interval: float) -> None:
+        intervals.append(interval)
+        if len(intervals) == 4:
+            raise RuntimeError("stop polling")
+
+    with patch("dlt.load.load.sleep", side_effect=_sleep):
+        with pytest.raises(RuntimeError):
+            load.run(None)
+    assert intervals == pytest.approx([0.1, 0.15, 0.225, 0.3])
+
+
 def test_load_single_thread() -> None:
     os.environ["LOAD__WORKERS"] = "1"
     load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))